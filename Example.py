@@ -1,14 +1,23 @@
 import time
 import sys
 
+# flag -> (option name, converter) for flags that take a value
+HANDLERS = {
+    "--log": ("log_path", str),
+    "-l": ("log_path", str),
+}
+
 def main():
-    log_path = None
+    opts = {"log_path": None}
 
     # Parse args manually (so you can test log passing)
     args = sys.argv[1:]
     for i, a in enumerate(args):
-        if a in ("--log", "-l") and i+1 < len(args):
-            log_path = args[i+1]
+        h = HANDLERS.get(a)
+        if h and i+1 < len(args):
+            name, conv = h
+            opts[name] = conv(args[i+1])
+    log_path = opts["log_path"]
 
     print("=== Test Script Started ===")
     if log_path:
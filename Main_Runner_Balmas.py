@@ -2,19 +2,83 @@
 import sys
 import os
 import re
-from typing import List, Optional, Dict, Any
-
-from PySide6.QtCore import Qt, QSize, Slot, QEvent,QProcess
-from PySide6.QtGui import QIcon, QAction, QTextCursor,QTextCharFormat, QColor
+import io
+import codecs
+import runpy
+import tempfile
+import threading
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Callable, Deque, NamedTuple, Sequence, Tuple
+
+from PySide6.QtCore import (
+    Qt, QSize, SIGNAL, Slot, QEvent, QProcess, QProcessEnvironment, QRunnable,
+    QThreadPool, QTimer
+)
+from PySide6.QtGui import QIcon, QTextCursor, QTextCharFormat, QColor
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFileDialog, QHBoxLayout, QVBoxLayout,
-    QLabel, QPushButton, QListWidget, QListWidgetItem, QFormLayout, QLineEdit,
+    QLabel, QPushButton, QListWidget, QFormLayout, QLineEdit,
     QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox, QTextEdit, QGroupBox,
-    QProgressBar, QMessageBox, QToolBar, QToolTip
+    QProgressBar, QMessageBox, QToolBar, QToolTip, QStackedWidget
 )
 
 PYTHON = sys.executable  # use same interpreter
 
+# "PROGRESS <0..100>" marker emitted by child scripts; compiled once, matched on raw bytes
+_PROGRESS_RE = re.compile(rb"^\s*PROGRESS\s+(\d{1,3})\s*$", re.IGNORECASE)
+# an unfinished line longer than this cannot become a PROGRESS line; it is replaced by
+# a NUL byte, which keeps the rest of that line from ever parsing as a marker
+_PARTIAL_MAX = 256
+# log lines painted red in the log pane
+_HIGHLIGHT_RE = re.compile(r"error|traceback", re.IGNORECASE)
+_HIGHLIGHT_PROBE = 1000  # chars at the start of a line that are checked for a marker
+# QTextCursor.selectedText() uses U+2029 (paragraph separator) for line breaks
+_PARAGRAPH_SEP = "\u2029"
+# pasted text that ticks a checkbox
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
+
+def _parse_progress(line: bytes) -> Optional[int]:
+    """Return the clamped value of a PROGRESS line, or None for any other line."""
+    s = line.strip()
+    if s[:8].upper() != b"PROGRESS":
+        return None
+    # fast path: "PROGRESS <digits>"; the regex only sees odd-looking marker lines
+    parts = s.split(None, 1)
+    if len(parts) == 2 and len(parts[0]) == 8 and parts[1].isdigit() and len(parts[1]) <= 3:
+        # at most three ASCII digits: accumulate them directly instead of going through int()
+        v = 0
+        for c in parts[1]:
+            v = v * 10 + c - 48
+        return v if v < 100 else 100
+    m = _PROGRESS_RE.match(s)
+    return min(100, int(m.group(1))) if m else None
+
+
+def _last_progress(data: bytes, end: Optional[int] = None) -> Optional[int]:
+    """Return the value of the last PROGRESS line in data[:end], or None.
+
+    Scans backwards for the marker instead of splitting the whole chunk into lines;
+    earlier PROGRESS lines in the same chunk would be overwritten anyway.
+    """
+    limit = len(data) if end is None else end
+    if not limit:
+        return None
+    hay = data.upper()  # the marker is case-insensitive
+    end = limit
+    while True:
+        idx = hay.rfind(b"PROGRESS", 0, end)
+        if idx < 0:
+            return None
+        start = hay.rfind(b"\n", 0, idx) + 1
+        stop = hay.find(b"\n", idx, limit)
+        val = _parse_progress(data[start:stop if stop >= 0 else limit])
+        if val is not None:
+            return val
+        end = start
+
 """
 Field schema (per script):
 {
@@ -27,6 +91,7 @@ Field schema (per script):
   "min": 0, "max": 100, "step": 1, # for int/float
   "options": ["fast","accurate"],  # for select
 }
+Entries are turned into FieldSchema objects at import (see _compile_field).
 """
 
 SCRIPTS: List[Dict[str, Any]] = [
@@ -43,7 +108,17 @@ SCRIPTS: List[Dict[str, Any]] = [
     #         {"key": "--dry-run", "label": "Dry run", "type": "checkbox", "required": False, "default": False},
     #     ],
     #     # how to pass the log file: "--log <path>" or positional
-    #     "log_arg_style": "--log"
+    #     "log_arg_style": "--log",
+    #     # False: the script prints no PROGRESS, so its output goes straight to a temp file
+    #     # and is loaded into the log when it ends (default True: live log + progress)
+    #     "emits_progress": True,
+    #     # True: run the script inside this interpreter on a worker thread instead of spawning
+    #     # a new Python per click; only for short scripts that are safe to re-run in-process
+    #     # (such runs cannot be cancelled)
+    #     "in_process": False,
+    #     # True: the child writes straight to this app's own stdout/stderr (the terminal it was
+    #     # started from); nothing is captured, so no log pane output and no progress
+    #     "forward_io": False
     # },
     {
         "name": "Find Family",
@@ -82,7 +157,8 @@ SCRIPTS: List[Dict[str, Any]] = [
         "args_schema": [
             # {"key": "--user", "label": "User", "type": "text", "required": False, "placeholder": "e.g. Pavel"}
         ],
-        "log_arg_style": "--log"
+        "log_arg_style": "--log",
+        "emits_progress": False
     },
     {
     "name": "Test Script",
@@ -107,131 +183,175 @@ SCRIPTS: List[Dict[str, Any]] = [
 
 ]
 
-# ---------- Dynamic form ----------
 
-class DynamicForm(QWidget):
-    """Builds a dynamic form for a given args schema and provides value/validation APIs."""
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.form = QFormLayout(self)
-        self.form.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
-        self.bindings: List[Dict[str, Any]] = []  # each: {"schema":..., "widget":...}
-            
+@dataclass(frozen=True, slots=True)
+class FieldSchema:
+    """One args_schema entry with every key present; None means "use the widget's default"."""
+    key: str
+    label: str
+    type: str = "text"
+    required: bool = False
+    default: Any = None
+    placeholder: Optional[str] = None
+    options: Tuple[Any, ...] = ()
+    min: Optional[float] = None
+    max: Optional[float] = None
+    step: Optional[float] = None
+    filter: str = "All Files (*)"
+    dialog_title: Optional[str] = None
+
+
+_FIELD_NAMES = frozenset(FieldSchema.__dataclass_fields__)
+
+
+def _compile_field(entry: Dict[str, Any]) -> FieldSchema:
+    # keys FieldSchema doesn't know are ignored, like the plain dict reads used to
+    fields = {k: v for k, v in entry.items() if k in _FIELD_NAMES}
+    fields.setdefault("key", "")  # no key: positional field
+    fields.setdefault("label", fields["key"])
+    if "options" in fields:
+        fields["options"] = tuple(fields["options"])
+    return FieldSchema(**fields)
+
+
+@dataclass(slots=True)
+class Script:
+    """A SCRIPTS entry resolved once at import: defaults applied, path made absolute and checked."""
+    name: str
+    path: str
+    abs_path: str
+    exists: bool
+    clue: str
+    args_schema: Tuple[FieldSchema, ...]
+    log_arg_style: str
+    emits_progress: bool
+    in_process: bool
+    forward_io: bool
+
+
+def _compile_script(entry: Dict[str, Any]) -> Script:
+    abs_path = os.path.abspath(entry["path"])
+    return Script(
+        name=entry["name"],
+        path=entry["path"],
+        abs_path=abs_path,
+        exists=os.path.exists(abs_path),
+        clue=entry.get("clue", "No clue available."),
+        args_schema=tuple(_compile_field(f) for f in entry.get("args_schema", [])),
+        log_arg_style=entry.get("log_arg_style", "--log"),
+        emits_progress=entry.get("emits_progress", True),
+        in_process=entry.get("in_process", False),
+        forward_io=entry.get("forward_io", False),
+    )
+
+
+SCRIPTS_COMPILED: List[Script] = [_compile_script(s) for s in SCRIPTS]
+
+# ---------- In-process runs ----------
+
+class _QueueSink(io.RawIOBase):
+    """Binary stdout replacement that queues every write for the GUI thread to collect."""
+
+    def __init__(self, chunks: Deque[bytes]):
+        super().__init__()
+        self._chunks = chunks
 
-    def clear(self):
-        while self.form.rowCount():
-            self.form.removeRow(0)
-        self.bindings.clear()
+    def writable(self) -> bool:
+        return True
 
-    def build(self, schema_list: List[Dict[str, Any]]):
-        self.clear()
-        for sch in schema_list:
-            w = self._make_widget(sch)
-            label_text = sch.get("label", sch.get("key", ""))
-            if sch.get("required"):
-                label_text += " *"
-            self.form.addRow(label_text, w)
-            self.bindings.append({"schema": sch, "widget": w})
-
-    def _make_widget(self, sch: Dict[str, Any]) -> QWidget:
-        t = sch.get("type", "text")
-        if t == "text":
-            w = QLineEdit()
-            if "placeholder" in sch:
-                w.setPlaceholderText(sch["placeholder"])
-            if "default" in sch:
-                w.setText(str(sch["default"]))
-            return w
-        if t == "int":
-            w = QSpinBox()
-            w.setMinimum(int(sch.get("min", -10**9)))
-            w.setMaximum(int(sch.get("max", 10**9)))
-            w.setValue(int(sch.get("default", 0)))
-            w.setSingleStep(int(sch.get("step", 1)))
-            return w
-        if t == "float":
-            w = QDoubleSpinBox()
-            w.setDecimals(6)
-            w.setMinimum(float(sch.get("min", -1e9)))
-            w.setMaximum(float(sch.get("max", 1e9)))
-            w.setValue(float(sch.get("default", 0.0)))
-            w.setSingleStep(float(sch.get("step", 0.1)))
-            return w
-        if t == "select":
-            w = QComboBox()
-            options = sch.get("options", [])
-            w.addItems([str(o) for o in options])
-            if "default" in sch and sch["default"] in options:
-                w.setCurrentText(str(sch["default"]))
-            return w
-        if t == "checkbox":
-            w = QCheckBox()
-            w.setChecked(bool(sch.get("default", False)))
-            return w
-        if t == "file_open":
-            return FilePicker(
-                mode="open",
-                dialog_title=sch.get("dialog_title", "Choose file"),
-                name_filter=sch.get("filter", "All Files (*)")
-            )
+    def write(self, b) -> int:
+        data = bytes(b)
+        if data:
+            self._chunks.append(data)  # deque.append is atomic, no lock needed
+        return len(data)
 
-        if t == "file_save":
-            return FilePicker(
-                mode="save",
-                dialog_title=sch.get("dialog_title", "Save file as"),
-                name_filter=sch.get("filter", "All Files (*)")
-            )
-        return QLineEdit()  # fallback
 
-    def validate_and_collect(self) -> Optional[List[str]]:
-        """Return list of error messages if any required fields are missing, else None."""
-        errors = []
-        for b in self.bindings:
-            sch, w = b["schema"], b["widget"]
-            val = self._value_of(w)
-            if sch.get("required"):
-                missing = (
-                    (isinstance(w, FilePicker) and val == "") or
-                    (isinstance(w, QLineEdit) and val == "") or
-                    (isinstance(w, (QSpinBox, QDoubleSpinBox)) and val is None) or
-                    (isinstance(w, QComboBox) and (val is None or val == ""))
-                )
-                if missing:
-                    errors.append(f"'{sch.get('label', sch.get('key'))}' is required.")
-        return errors if errors else None
+class _ThreadRoutedStream:
+    """Stands in for sys.stdout/sys.stderr: a thread with a registered route writes there,
+    every other thread (the GUI included) keeps writing to the original stream."""
+
+    def __init__(self, default):
+        self._default = default
+        self._routes: Dict[int, Any] = {}
+
+    def _target(self):
+        return self._routes.get(threading.get_ident(), self._default)
+
+    def route(self, stream):
+        self._routes[threading.get_ident()] = stream
+
+    def unroute(self):
+        self._routes.pop(threading.get_ident(), None)
+
+    def write(self, s):
+        target = self._target()
+        return target.write(s) if target is not None else len(s)
+
+    def flush(self):
+        target = self._target()
+        if target is not None:
+            target.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+
+def _routed_std_streams() -> Tuple[_ThreadRoutedStream, _ThreadRoutedStream]:
+    """Put routing proxies in front of sys.stdout/sys.stderr once and return them."""
+    if not isinstance(sys.stdout, _ThreadRoutedStream):
+        sys.stdout = _ThreadRoutedStream(sys.stdout)
+    if not isinstance(sys.stderr, _ThreadRoutedStream):
+        sys.stderr = _ThreadRoutedStream(sys.stderr)
+    return sys.stdout, sys.stderr
 
-    def build_cli_args(self) -> List[str]:
-        """Build CLI arg list according to schema and current values."""
-        args: List[str] = []
-        for b in self.bindings:
-            sch, w = b["schema"], b["widget"]
-            key = sch.get("key", "")
-            val = self._value_of(w)
-            t = sch.get("type", "text")
-
-            if key and t != "checkbox":
-                args.append(str(key))
-                args.append(str(val))
-            elif key and t == "checkbox":
-                if bool(val):
-                    args.append(str(key))
-             # if key == "", you could push positional-only here if desired
-        return args
-    
-    def _value_of(self, w: QWidget):
-        if isinstance(w, QLineEdit):
-            return w.text().strip()
-        if isinstance(w, QSpinBox):
-            return w.value()
-        if isinstance(w, QDoubleSpinBox):
-            return w.value()
-        if isinstance(w, QComboBox):
-            return w.currentText()
-        if isinstance(w, QCheckBox):
-            return w.isChecked()
-        if isinstance(w, FilePicker):
-            return w.text()
-        return None
+
+class _InProcessRun(QRunnable):
+    """Execute a script file as __main__ on a pool thread.
+
+    stdout/stderr of the pool thread alone are routed into ``chunks`` as raw bytes;
+    sys.argv is the one global swapped for the run. ``exit_code`` is set last and the
+    GUI polls both on a timer, so nothing crosses threads through Qt signals. Once
+    ``discarded`` is set the window no longer wants the result.
+    """
+
+    def __init__(self, path: str, argv: List[str]):
+        super().__init__()
+        self.setAutoDelete(False)  # the window keeps it until the result is collected
+        self.path = path
+        self.argv = argv
+        self.chunks: Deque[bytes] = deque()
+        self.exit_code: Optional[int] = None
+        self.discarded = False
+        # installed from the GUI thread, before the worker can print anything
+        self.streams = _routed_std_streams()
+
+    def run(self):
+        out = io.TextIOWrapper(_QueueSink(self.chunks), encoding="utf-8",
+                               errors="replace", line_buffering=True, write_through=True)
+        saved_argv = sys.argv
+        sys.argv = self.argv
+        for stream in self.streams:
+            stream.route(out)  # merged, like MergedChannels
+        code = 0
+        try:
+            runpy.run_path(self.path, run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, int):
+                code = e.code
+            else:
+                print(e.code, file=out)
+                code = 1
+        except BaseException:
+            traceback.print_exc(file=out)
+            code = 1
+        finally:
+            for stream in self.streams:
+                stream.unroute()
+            sys.argv = saved_argv
+            out.flush()
+        self.exit_code = code
 
 # ---------- Browse another log option ----------
 class FilePicker(QWidget):
@@ -284,8 +404,297 @@ class FilePicker(QWidget):
         if hasattr(mw, "set_status"):
             mw.set_status(f"File dropped: {os.path.basename(file_path)}")
     
+# ---------- Dynamic form ----------
+
+def _make_text(sch: FieldSchema) -> QWidget:
+    w = QLineEdit()
+    if sch.placeholder is not None:
+        w.setPlaceholderText(sch.placeholder)
+    if sch.default is not None:
+        w.setText(str(sch.default))
+    return w
+
+
+def _make_int(sch: FieldSchema) -> QWidget:
+    w = QSpinBox()
+    w.setMinimum(int(-10**9 if sch.min is None else sch.min))
+    w.setMaximum(int(10**9 if sch.max is None else sch.max))
+    w.setValue(int(0 if sch.default is None else sch.default))
+    w.setSingleStep(int(1 if sch.step is None else sch.step))
+    return w
+
+
+def _make_float(sch: FieldSchema) -> QWidget:
+    w = QDoubleSpinBox()
+    w.setDecimals(6)
+    w.setMinimum(float(-1e9 if sch.min is None else sch.min))
+    w.setMaximum(float(1e9 if sch.max is None else sch.max))
+    w.setValue(float(0.0 if sch.default is None else sch.default))
+    w.setSingleStep(float(0.1 if sch.step is None else sch.step))
+    return w
+
+
+def _make_select(sch: FieldSchema) -> QWidget:
+    w = QComboBox()
+    options = sch.options
+    w.addItems([str(o) for o in options])
+    if sch.default is not None and sch.default in options:
+        w.setCurrentText(str(sch.default))
+    return w
+
+
+def _make_checkbox(sch: FieldSchema) -> QWidget:
+    w = QCheckBox()
+    w.setChecked(bool(sch.default))
+    return w
+
+
+def _make_file_open(sch: FieldSchema) -> QWidget:
+    return FilePicker(
+        mode="open",
+        dialog_title=sch.dialog_title or "Choose file",
+        name_filter=sch.filter
+    )
+
+
+def _make_file_save(sch: FieldSchema) -> QWidget:
+    return FilePicker(
+        mode="save",
+        dialog_title=sch.dialog_title or "Save file as",
+        name_filter=sch.filter
+    )
+
+
+def _make_fallback(sch: FieldSchema) -> QWidget:
+    return QLineEdit()
+
+
+# schema "type" -> widget factory, looked up once per field
+_WIDGET_FACTORIES = {
+    "text": _make_text,
+    "int": _make_int,
+    "float": _make_float,
+    "select": _make_select,
+    "checkbox": _make_checkbox,
+    "file_open": _make_file_open,
+    "file_save": _make_file_save,
+}
+
+
+class Binding(NamedTuple):
+    """One form row: its schema entry, the input widget and the accessors resolved at build time."""
+    schema: FieldSchema
+    widget: QWidget
+    read: Callable[[QWidget], Any]
+    empty: Callable[[QWidget], bool]
+
+
+class DynamicForm(QWidget):
+    """Builds a dynamic form for a given args schema and provides value/validation APIs."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._outer = QVBoxLayout(self)
+        self._outer.setContentsMargins(0, 0, 0, 0)
+        self._new_container()
+        self.bindings: List[Binding] = []
+        self._arg_emitters = self._compile_cli_args()
+            
+
+    def _new_container(self):
+        # rows live in their own container so clear() can drop them all at once
+        self._container = QWidget(self)
+        self.form = QFormLayout(self._container)
+        self.form.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        self._outer.addWidget(self._container)
+
+    def clear(self):
+        if self.form.rowCount():
+            # one container teardown instead of a removeRow() per field
+            self._container.hide()
+            self._outer.removeWidget(self._container)
+            self._container.deleteLater()
+            self._new_container()
+        self.bindings.clear()
+        self._arg_emitters = self._compile_cli_args()
+
+    def build(self, schema_list: Sequence[FieldSchema]):
+        self.clear()
+        for sch in schema_list:
+            w = self._make_widget(sch)
+            label_text = sch.label
+            if sch.required:
+                label_text += " *"
+            self.form.addRow(label_text, w)
+            read = self._READERS.get(type(w), DynamicForm._read_none)
+            empty = self._EMPTY_CHECKS.get(type(w), DynamicForm._never_empty)
+            self.bindings.append(Binding(sch, w, read, empty))
+        self._arg_emitters = self._compile_cli_args()
+
+    def _make_widget(self, sch: FieldSchema) -> QWidget:
+        return _WIDGET_FACTORIES.get(sch.type, _make_fallback)(sch)
+
+    def validate_and_collect(self) -> Optional[List[str]]:
+        """Return list of error messages if any required fields are missing, else None."""
+        errors = []
+        for b in self.bindings:
+            sch = b.schema
+            if sch.required and b.empty(b.widget):
+                errors.append(f"'{sch.label}' is required.")
+        return errors if errors else None
+
+    def build_cli_args(self) -> List[str]:
+        """Build CLI arg list according to schema and current values."""
+        args: List[str] = []
+        for emit in self._arg_emitters:
+            emit(args)
+        return args
+
+    def _compile_cli_args(self) -> List[Callable[[List[str]], None]]:
+        """Fix the schema into one emitter per keyed field; each appends its CLI tokens to a list."""
+        emitters = []
+        for b in self.bindings:
+            sch, w = b.schema, b.widget
+            key = sch.key
+            if not key:
+                continue  # if key == "", you could push positional-only here if desired
+            if sch.type == "checkbox":
+                # checkbox passes its flag only when checked
+                def emit(out, key=key, w=w, checked=b.read):
+                    if checked(w):
+                        out.append(key)
+            else:
+                fmt = self._ARG_FORMATTERS.get(type(w), lambda w, read=b.read: str(read(w)))
+
+                def emit(out, key=key, w=w, fmt=fmt):
+                    out.append(key)
+                    out.append(fmt(w))
+            emitters.append(emit)
+        return emitters
+    
+    @staticmethod
+    def _read_none(w: QWidget):
+        return None
+
+    @staticmethod
+    def _never_empty(w: QWidget) -> bool:
+        return False
+
+    # widget class -> value accessor; every widget is built by a factory above, so exact types match
+    _READERS = {
+        QLineEdit: lambda w: w.text().strip(),
+        QSpinBox: QSpinBox.value,
+        QDoubleSpinBox: QDoubleSpinBox.value,
+        QComboBox: QComboBox.currentText,
+        QCheckBox: QCheckBox.isChecked,
+        FilePicker: FilePicker.text,
+    }
+
+    # widget class -> CLI value; text widgets already yield str, numbers are formatted directly
+    _ARG_FORMATTERS = {
+        QLineEdit: _READERS[QLineEdit],
+        QComboBox: QComboBox.currentText,
+        FilePicker: FilePicker.text,
+        QSpinBox: lambda w: str(w.value()),
+        QDoubleSpinBox: lambda w: str(w.value()),
+    }
+
+    # widget class -> "required field left blank" check; spin boxes and checkboxes always hold a value
+    _EMPTY_CHECKS = {
+        QLineEdit: lambda w: not w.text().strip(),
+        QComboBox: lambda w: not w.currentText(),
+        FilePicker: lambda w: not w.text(),
+    }
+
 # ---------- Main window ----------
 
+# window stylesheets, one per theme; apply_theme only swaps between these two strings
+_DARK_QSS = """
+    QMainWindow { background: #1e1f24; color: #f0f0f0; }
+    QLabel, QGroupBox, QListWidget, QTextEdit { color: #f0f0f0; }
+    QGroupBox { border: 1px solid #3a3d46; border-radius: 6px; margin-top: 12px; }
+    QGroupBox::title { subcontrol-origin: margin; left: 9px; padding: 0 3px; }
+    QPushButton { margin: 2px; background: qlineargradient(x1:0, y1:0, x2:0,y2:1, stop:0 #555555, stop:1 #333333); border: 1px solid #3a3d46; padding: 4px 4px; border-radius: 4px; color: #E0E0E0; }
+    QPushButton:hover { background: #3a3f4d; }
+    QListWidget { background: #2b2f3a; border: 1px solid #3a3d46; }
+    QTextEdit { background: #111217; border: 1px solid #3a3d46; }
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox { background: #2b2f3a; border: 1px solid #3a3d46; color: #f0f0f0; padding: 4px; }
+    QProgressBar { background: #2b2f3a; border: 1px solid #3a3d46; border-radius: 3px; text-align: center; color: #f0f0f0; }
+    QProgressBar::chunk { background-color: #4c8bf5; }
+    
+    QPushButton#RunButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #0D0D0D, stop:1 #1B5E20);
+        color: #FFFFFF;
+        border: 1px solid #2E7D32;
+        }
+    QPushButton#RunButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #1B5E20, stop:1 #2E7D32);
+        }
+    QPushButton#CancelButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #0D0D0D, stop:1 #7F0000); 
+        color: #FFFFFF;
+        border: 1px solid #B71C1C;
+        }
+    QPushButton#CancelButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #7F0000, stop:1 #B71C1C);
+        }
+    """
+
+_LIGHT_QSS = """
+    QMainWindow { background: #f8f8f8; color: #222; }
+    QLabel, QGroupBox, QListWidget, QTextEdit { color: #222; }
+    QGroupBox { border: 1px solid #ccc; border-radius: 6px; margin-top: 12px; }
+    QGroupBox::title { subcontrol-origin: margin; left: 9px; padding: 0 3px; }
+    QPushButton { margin: 2px; background: qlineargradient(x1:0, y1:0, x2:0,y2:1, stop:0 #F5F5F5, stop:1 #ADADAD); border: 1px solid #ccc; padding: 4px 4px; border-radius: 4px; }
+    QPushButton:hover { background: #eaeaea; }
+    QListWidget { background: #fff; border: 1px solid #ccc; }
+    QTextEdit { background: #f4f4f4; border: 1px solid #ccc; }
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox { background: #fff; border: 1px solid #ccc; color: #222; padding: 4px; }
+    QProgressBar { background: #fff; border: 1px solid #ccc; border-radius: 3px; text-align: center; color: #222; }
+    QProgressBar::chunk { background-color: #4c8bf5; }
+    
+    QPushButton#RunButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #f8fff8, stop:1 #e0ffe0);
+        color: #222;
+        border: 1px solid #b2dfdb;
+    }
+    QPushButton#RunButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #e0ffe0, stop:1 #c8f7c8);
+    }
+    QPushButton#CancelButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #fff8f8, stop:1 #ffe0e0);
+        color: #222;
+        border: 1px solid #ef9a9a;
+    }
+    QPushButton#CancelButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #ffe0e0, stop:1 #ffcccc);
+    }
+    """
+
+
+# message boxes get their own sheet in the dark theme; the light theme uses the default look
+_DARK_MSG_QSS = """
+    QMessageBox {
+        background-color: #232323;
+        color: #f0f0f0;
+    }
+    QLabel {
+        color: #f0f0f0;
+    }
+    QPushButton {
+        background-color: #444;
+        color: #f0f0f0;
+    }
+"""
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -372,8 +781,7 @@ class MainWindow(QMainWindow):
         self.btn_clue.clicked.connect(self.show_script_clue)
         scripts_layout.addWidget(self.btn_clue)
         
-        for s in SCRIPTS:
-            self.list_scripts.addItem(QListWidgetItem(s["name"]))
+        self.list_scripts.addItems([s.name for s in SCRIPTS_COMPILED])
         self.list_scripts.currentRowChanged.connect(self.on_script_change)
         scripts_layout.addWidget(self.list_scripts)
         left_panel.addWidget(scripts_box, 1)
@@ -408,8 +816,20 @@ class MainWindow(QMainWindow):
 
         self.form_box = QGroupBox("Parameters")
         form_layout = QVBoxLayout(self.form_box)
-        self.form = DynamicForm()
-        form_layout.addWidget(self.form)
+        # one DynamicForm page per script, all built up front, so moving through the
+        # scripts list never creates widgets and entered values survive switching
+        self.form_stack = QStackedWidget()
+        self.forms: List[DynamicForm] = []
+        for s in SCRIPTS_COMPILED:
+            form = DynamicForm()
+            form.build(s.args_schema)
+            self.forms.append(form)
+            self.form_stack.addWidget(form)
+        self._empty_form = DynamicForm()  # shown when no script is selected
+        self.form_stack.addWidget(self._empty_form)
+        self.form = self._empty_form
+        self.form_stack.setCurrentWidget(self.form)
+        form_layout.addWidget(self.form_stack)
         center_panel.addWidget(self.form_box)
 
         prog_row = QHBoxLayout()
@@ -425,91 +845,72 @@ class MainWindow(QMainWindow):
         log_layout = QVBoxLayout(log_box)
         self.txt_log = QTextEdit()
         self.txt_log.setReadOnly(False)
+        # keep only the newest lines so long runs don't grow the document without bound
+        self.txt_log.document().setMaximumBlockCount(5000)
+        # the block cap already turns undo off; say so explicitly so inserts never feed an undo stack
+        self.txt_log.setUndoRedoEnabled(False)
         log_layout.addWidget(self.txt_log)
+        # appends go through one long-lived cursor and two shared formats
+        self._log_cursor = self.txt_log.textCursor()
+        self._fmt_plain = QTextCharFormat()
+        self._fmt_error = QTextCharFormat()
+        self._fmt_error.setForeground(QColor("red"))
+        self._log_scroll = self.txt_log.verticalScrollBar()
         center_panel.addWidget(log_box, 1)
 
-        self.current_script: Optional[Dict[str, Any]] = None
+        self.current_script: Optional[Script] = None
         self.log_file_path: Optional[str] = None
         self.proc = None  # QProcess instance
+        self._inproc: Optional[_InProcessRun] = None  # running in-process script, if any
+
+        # child stdout is a pipe, so Python would block-buffer it and delay PROGRESS lines;
+        # the environment is built once and reused for every run
+        self._proc_env = QProcessEnvironment.systemEnvironment()
+        self._proc_env.insert("PYTHONUNBUFFERED", "1")
+
+        # stdout is buffered and flushed into the log pane on a short timer,
+        # so chatty scripts cost one QTextEdit insert per tick instead of per chunk
+        self._log_buf = bytearray()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = b""  # trailing stdout bytes after the last newline
+        self._out_file: Optional[str] = None  # temp stdout file of a non-progress run
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(75)
+        self._flush_timer.timeout.connect(self._flush_log)
+
+        # same idea for the progress bar: keep only the newest value and paint it on a tick
+        self._pending_progress = -1
+        self._prog_timer = QTimer(self)
+        self._prog_timer.setSingleShot(True)
+        self._prog_timer.setInterval(50)
+        self._prog_timer.timeout.connect(self._flush_progress)
+        # the indeterminate bar animates (and repaints) nonstop, so it is held back
+        # for runs that stay silent about progress past the first 2 s
+        self._busy_timer = QTimer(self)
+        self._busy_timer.setSingleShot(True)
+        self._busy_timer.setInterval(2000)
+        self._busy_timer.timeout.connect(self._maybe_busy)
+
+        # in-process runs hand their output over through a queue polled at log-flush pace
+        self._inproc_timer = QTimer(self)
+        self._inproc_timer.setInterval(30)
+        self._inproc_timer.timeout.connect(self._poll_in_process)
         self.recent_runs: List[Dict[str, Any]] = []
+        # one message box per window, re-texted for every show_message call
+        self._msg_box = QMessageBox(self)
 
-        if SCRIPTS:
+        if SCRIPTS_COMPILED:
             self.list_scripts.setCurrentRow(0)
 
         self.apply_theme()
 
     def apply_theme(self):
         if self.theme_is_dark:
-            self.setStyleSheet("""
-                QMainWindow { background: #1e1f24; color: #f0f0f0; }
-                QLabel, QGroupBox, QListWidget, QTextEdit { color: #f0f0f0; }
-                QGroupBox { border: 1px solid #3a3d46; border-radius: 6px; margin-top: 12px; }
-                QGroupBox::title { subcontrol-origin: margin; left: 9px; padding: 0 3px; }
-                QPushButton { margin: 2px; background: qlineargradient(x1:0, y1:0, x2:0,y2:1, stop:0 #555555, stop:1 #333333); border: 1px solid #3a3d46; padding: 4px 4px; border-radius: 4px; color: #E0E0E0; }
-                QPushButton:hover { background: #3a3f4d; }
-                QListWidget { background: #2b2f3a; border: 1px solid #3a3d46; }
-                QTextEdit { background: #111217; border: 1px solid #3a3d46; }
-                QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox { background: #2b2f3a; border: 1px solid #3a3d46; color: #f0f0f0; padding: 4px; }
-                QProgressBar { background: #2b2f3a; border: 1px solid #3a3d46; border-radius: 3px; text-align: center; color: #f0f0f0; }
-                QProgressBar::chunk { background-color: #4c8bf5; }
-                
-                QPushButton#RunButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #0D0D0D, stop:1 #1B5E20);
-                    color: #FFFFFF;
-                    border: 1px solid #2E7D32;
-                    }
-                QPushButton#RunButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1B5E20, stop:1 #2E7D32);
-                    }
-                QPushButton#CancelButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #0D0D0D, stop:1 #7F0000); 
-                    color: #FFFFFF;
-                    border: 1px solid #B71C1C;
-                    }
-                QPushButton#CancelButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #7F0000, stop:1 #B71C1C);
-                    }
-                """)
+            self.setStyleSheet(_DARK_QSS)
             self.btn_theme.setText("🌞")  # Sun icon
         else:
-            self.setStyleSheet("""
-                QMainWindow { background: #f8f8f8; color: #222; }
-                QLabel, QGroupBox, QListWidget, QTextEdit { color: #222; }
-                QGroupBox { border: 1px solid #ccc; border-radius: 6px; margin-top: 12px; }
-                QGroupBox::title { subcontrol-origin: margin; left: 9px; padding: 0 3px; }
-                QPushButton { margin: 2px; background: qlineargradient(x1:0, y1:0, x2:0,y2:1, stop:0 #F5F5F5, stop:1 #ADADAD); border: 1px solid #ccc; padding: 4px 4px; border-radius: 4px; }
-                QPushButton:hover { background: #eaeaea; }
-                QListWidget { background: #fff; border: 1px solid #ccc; }
-                QTextEdit { background: #f4f4f4; border: 1px solid #ccc; }
-                QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox { background: #fff; border: 1px solid #ccc; color: #222; padding: 4px; }
-                QProgressBar { background: #fff; border: 1px solid #ccc; border-radius: 3px; text-align: center; color: #222; }
-                QProgressBar::chunk { background-color: #4c8bf5; }
-                
-                QPushButton#RunButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f8fff8, stop:1 #e0ffe0);
-                    color: #222;
-                    border: 1px solid #b2dfdb;
-                }
-                QPushButton#RunButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e0ffe0, stop:1 #c8f7c8);
-                }
-                QPushButton#CancelButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #fff8f8, stop:1 #ffe0e0);
-                    color: #222;
-                    border: 1px solid #ef9a9a;
-                }
-                QPushButton#CancelButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffe0e0, stop:1 #ffcccc);
-                }
-                """)
+            self.setStyleSheet(_LIGHT_QSS)
             self.btn_theme.setText("🌙")  # Moon icon
 
     def toggle_theme(self):
@@ -559,24 +960,13 @@ class MainWindow(QMainWindow):
         return super().eventFilter(obj, event)
     
     def show_message(self, title, text, icon=QMessageBox.Information):
-        msg = QMessageBox(self)
+        msg = self._msg_box
         msg.setWindowTitle(title)
         msg.setText(text)
         msg.setIcon(icon)
-        if self.theme_is_dark:
-            msg.setStyleSheet("""
-                QMessageBox {
-                    background-color: #232323;
-                    color: #f0f0f0;
-                }
-                QLabel {
-                    color: #f0f0f0;
-                }
-                QPushButton {
-                    background-color: #444;
-                    color: #f0f0f0;
-                }
-            """)
+        qss = _DARK_MSG_QSS if self.theme_is_dark else ""
+        if msg.styleSheet() != qss:  # restyle only after a theme switch
+            msg.setStyleSheet(qss)
         msg.exec()
             
     # ---------- UI actions ----------
@@ -605,16 +995,28 @@ class MainWindow(QMainWindow):
 
     @Slot(int)
     def on_script_change(self, row: int):
-        if row < 0 or row >= len(SCRIPTS):
+        if row < 0 or row >= len(SCRIPTS_COMPILED):
             self.current_script = None
-            self.form.clear()
+            self.form = self._empty_form
+            self.form_stack.setCurrentWidget(self.form)
             return
-        self.current_script = SCRIPTS[row]
-        self.form.build(self.current_script.get("args_schema", []))
-        self.set_status(f"Selected: {self.current_script['name']}")
+        self.current_script = SCRIPTS_COMPILED[row]
+        self.form = self.forms[row]
+        self.form_stack.setCurrentIndex(row)
+        self.set_status(f"Selected: {self.current_script.name}")
+
+    def _inproc_busy(self) -> bool:
+        """True, with a status note, while an in-process script still holds its pool thread."""
+        if self._inproc is None:
+            return False
+        # it cannot be killed, so a new run waits until it has finished
+        self.set_status("Still running in-process script...")
+        return True
 
     @Slot()
     def on_run_clicked(self):
+        if self._inproc_busy():
+            return
         if not self.log_file_path:
             self.show_message("Missing file", "Please choose a log file.",QMessageBox.Warning)
             return
@@ -626,10 +1028,10 @@ class MainWindow(QMainWindow):
             self.show_message("Validation", "\n".join(errors))
             return
 
-        script_path = self.current_script["path"]
-        args = [PYTHON, script_path]
+        script = self.current_script
+        args = [PYTHON, "-u", script.abs_path]
 
-        style = self.current_script.get("log_arg_style", "--log")
+        style = script.log_arg_style
         
         if style == "positional":
             args.append(self.log_file_path)
@@ -639,51 +1041,182 @@ class MainWindow(QMainWindow):
         args.extend(self.form.build_cli_args())
         args.extend(["--mode","gui"])
 
-        if not os.path.exists(script_path):
+        if not script.exists:
             self.show_message("Missing script", "Script is missing in the given directory",QMessageBox.Warning)
 
-        self.add_recent_run(self.current_script, args)
-        self.start_process(args)
+        self.add_recent_run(script, args)
+        self.start_process(args, script)
 
-    def start_process(self, args: List[str]):
+    def start_process(self, args: List[str], script: Script):
+        if self._inproc_busy():
+            return
 
+        self._flush_timer.stop()
+        self._log_buf.clear()
+        self._decoder.reset()
+        self._partial = b""
+        self._drop_pending_progress()
         self.txt_log.clear()
+        if self.progress.maximum() == 0:
+            self.progress.setRange(0, 100)
         self.progress.setValue(0)
-        self.progress.setRange(0, 0)  # busy until we see PROGRESS
+        self._busy_timer.start()  # go busy only if no PROGRESS shows up for a while
         self.set_status("Running...")
 
         self.btn_run.setEnabled(False)
         self.btn_cancel.setEnabled(True)
         self.list_scripts.setEnabled(False)
 
+        self._release_process()
+        if script.in_process:
+            self._start_in_process(args, script)
+            return
         self.proc = QProcess(self)
         self.proc.setProgram(args[0])
         self.proc.setArguments(args[1:])
-        self.proc.setProcessChannelMode(QProcess.MergedChannels)
-        self.proc.readyReadStandardOutput.connect(self.on_proc_output)
+        self.proc.setProcessEnvironment(self._proc_env)
+        if script.forward_io:
+            # child output bypasses the event loop entirely
+            self.proc.setProcessChannelMode(QProcess.ForwardedChannels)
+            self.append_log("[output is forwarded to the terminal]\n")
+        elif script.emits_progress:
+            self.proc.setProcessChannelMode(QProcess.MergedChannels)
+            self.proc.readyReadStandardOutput.connect(self.on_proc_output)
+        else:
+            self.proc.setProcessChannelMode(QProcess.MergedChannels)
+            # nothing to parse while it runs: let the child write straight to disk
+            fd, self._out_file = tempfile.mkstemp(prefix="runner_", suffix=".log")
+            os.close(fd)
+            self.proc.setStandardOutputFile(self._out_file)
         self.proc.finished.connect(self.on_proc_finished)
         self.proc.errorOccurred.connect(self.on_proc_error)
         self.proc.start()
 
+    def _start_in_process(self, args: List[str], script: Script):
+        """Run the script on the global thread pool; args keep the [python, "-u", path, ...] shape."""
+        self.btn_cancel.setEnabled(False)  # a Python thread cannot be stopped from outside
+        self._inproc = _InProcessRun(script.abs_path, [script.abs_path] + args[3:])
+        QThreadPool.globalInstance().start(self._inproc)
+        self._inproc_timer.start()
+
+    @Slot()
+    def _poll_in_process(self):
+        run = self._inproc
+        if run is None:
+            self._inproc_timer.stop()
+            return
+        code = run.exit_code  # read before draining: once set, every write is already queued
+        chunks = run.chunks
+        if run.discarded:
+            # cleared while running: throw its output away and just wait for the thread
+            chunks.clear()
+            if code is not None:
+                self._inproc_timer.stop()
+                self._inproc = None
+                self.btn_run.setEnabled(True)
+                self.list_scripts.setEnabled(True)
+                self.set_status("Ready")
+            return
+        if chunks:
+            data = [chunks.popleft() for _ in range(len(chunks))]
+            self._on_output_bytes(b"".join(data))
+        if code is not None:
+            self._inproc_timer.stop()
+            self._inproc = None
+            self.on_proc_finished(code, 0)
+
     @Slot()
     def on_proc_output(self):
-        data = self.proc.readAllStandardOutput().data().decode(errors="replace")
-        if not data:
+        raw = self.proc.readAllStandardOutput().data()
+        if raw:
+            self._on_output_bytes(raw)
+
+    def _on_output_bytes(self, raw: bytes):
+        # only queue here; parsing and decoding wait for the next flush tick, so a child
+        # bursting output costs the event loop one buffer append per readyRead
+        self._log_buf += raw
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _scan_progress(self, raw: bytes):
+        # Detect "PROGRESS <0..100>" on complete lines only; a line cut by the chunk
+        # boundary waits in _partial until the rest of it arrives
+        buf = self._partial + raw if self._partial else raw
+        i = buf.rfind(b"\n")
+        self._partial = buf[i + 1:]
+        if len(self._partial) > _PARTIAL_MAX:
+            self._partial = b"\0"  # \r-style bars and huge dumped lines stay O(chunk)
+        val = _last_progress(buf, i + 1)
+        if val is not None:
+            self._busy_timer.stop()
+            self._pending_progress = val
+            if not self._prog_timer.isActive():
+                self._prog_timer.start()
+
+    @Slot()
+    def _flush_progress(self):
+        """Show the latest PROGRESS value; runs at most every 50 ms however fast the output is."""
+        val, self._pending_progress = self._pending_progress, -1
+        if val < 0:
+            return
+        if self.progress.maximum() == 0:
+            self.progress.setRange(0, 100)
+        self.progress.setValue(val)
+        self.set_status(f"{val}%")
+
+    @Slot()
+    def _maybe_busy(self):
+        """Switch to the indeterminate bar for a run that has printed no PROGRESS so far."""
+        if self._pending_progress < 0 and self.progress.value() <= 0:
+            self.progress.setRange(0, 0)
+
+    def _drop_pending_progress(self):
+        self._busy_timer.stop()
+        self._prog_timer.stop()
+        self._pending_progress = -1
+
+    @Slot()
+    def _flush_log(self, final: bool = False):
+        """Scan the buffered stdout for PROGRESS, decode it once and append it to the log pane.
+
+        A UTF-8 sequence cut at the end of the buffer is held by the incremental
+        decoder until the rest of it arrives, or emitted as U+FFFD when ``final``.
+        """
+        self._flush_timer.stop()
+        if not self._log_buf and not final:
+            return
+        data = bytes(self._log_buf)
+        self._log_buf.clear()
+        if data:
+            self._scan_progress(data)
+        text = self._decoder.decode(data, final)
+        if text:
+            self.append_log(text)
+
+    def _load_output_file(self):
+        """Move the output of a file-redirected run into the log buffer and delete the file."""
+        if self._out_file is None:
             return
-        self.append_log(data)
-
-        # Detect "PROGRESS <0..100>"
-        for line in data.splitlines():
-            m = re.match(r"^\s*PROGRESS\s+(\d{1,3})\s*$", line.strip(), re.IGNORECASE)
-            if m:
-                val = max(0, min(100, int(m.group(1))))
-                if self.progress.maximum() == 0:
-                    self.progress.setRange(0, 100)
-                self.progress.setValue(val)
-                self.set_status(f"{val}%")
+        try:
+            with open(self._out_file, "rb") as f:
+                self._log_buf += f.read()
+        except OSError:
+            pass
+        self._remove_output_file()
+
+    def _remove_output_file(self):
+        path, self._out_file = self._out_file, None
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
     @Slot(int, int)
     def on_proc_finished(self, exitCode, exitStatus):
+        self._load_output_file()
+        self._flush_log(final=True)
+        self._drop_pending_progress()
         if self.progress.maximum() == 0:
             self.progress.setRange(0, 100)
         self.progress.setValue(100)
@@ -694,6 +1227,9 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def on_proc_error(self, err):
+        self._load_output_file()
+        self._flush_log(final=True)
+        self._drop_pending_progress()
         self.append_log(f"[Process error] {err}\n")
         self.btn_run.setEnabled(True)
         self.btn_cancel.setEnabled(False)
@@ -713,16 +1249,16 @@ class MainWindow(QMainWindow):
     #     for r in self.recent_runs:
     #         self.list_recent.addItem(r['display'])
 
-    def add_recent_run(self, script: Dict[str, Any], args: List[str]):
+    def add_recent_run(self, script: Script, args: List[str]):
         """Store and display the most recently executed script and its arguments."""
 
         # collect current values from form
         params = {}
         for b in self.form.bindings:
-            sch, w = b["schema"], b["widget"]
-            params[sch.get("key", "")] = self.form._value_of(w)
+            params[b.schema.key] = b.read(b.widget)
 
-        display = f"{script.get('name', '')} {' '.join(args[1:])}"
+        # args = [python, "-u", abs_path, ...]; show the script as configured
+        display = " ".join([script.name, script.path] + args[3:])
 
         self.recent_runs = [r for r in self.recent_runs if r.get('display') != display]
         self.recent_runs.insert(0, {
@@ -740,29 +1276,27 @@ class MainWindow(QMainWindow):
 
     def on_recent_run(self, item):
         """Double-click handler to re-populate form and optionally rerun."""
+        if self._inproc_busy():
+            return
         row = self.list_recent.row(item)
         if 0 <= row < len(self.recent_runs):
             entry = self.recent_runs[row]
 
             # set current script in UI
             script = entry['script']
-            if script in SCRIPTS:
-                idx = SCRIPTS.index(script)
+            if script in SCRIPTS_COMPILED:
+                idx = SCRIPTS_COMPILED.index(script)
                 self.list_scripts.setCurrentRow(idx)
 
-            # rebuild form with schema
-            self.form.build(script.get("args_schema", []))
-
             # restore saved parameter values
             params = entry.get('params', {})
             for b in self.form.bindings:
-                sch, w = b["schema"], b["widget"]
-                key = sch.get("key", "")
+                key = b.schema.key
                 if key in params:
-                    self._set_widget_value(w, str(params[key]))
+                    self._set_widget_value(b.widget, str(params[key]))
 
             self.set_status(f"Loaded parameters!")
-            self.start_process(entry['args'])
+            self.start_process(entry['args'], script)
 
     # def on_recent_run(self, item):
     #     """Double-click handler to rerun a previously executed script."""
@@ -775,6 +1309,8 @@ class MainWindow(QMainWindow):
     def on_cancel(self):
         if self.proc is not None:
             self.proc.kill()
+        self._flush_log()
+        self._drop_pending_progress()
         self.set_status("Cancelled")
         if self.progress.maximum() == 0:
             self.progress.setRange(0, 100)
@@ -783,32 +1319,63 @@ class MainWindow(QMainWindow):
         self.list_scripts.setEnabled(True)
 
     def append_log(self, text: str):
-        cursor = self.txt_log.textCursor()
+        cursor = self._log_cursor
         cursor.movePosition(QTextCursor.End)
-        for line in text.splitlines(True):
-            fmt = QTextCharFormat()
-            if re.search(r"(error|traceback)", line, re.IGNORECASE):
-                fmt.setForeground(QColor("red"))
-            cursor.insertText(line, fmt)
-        self.txt_log.setTextCursor(cursor)
-        self.txt_log.ensureCursorVisible()
+        # text between highlighted lines goes in as a single plain insert,
+        # each line holding a marker is inserted in red
+        pos = 0
+        # most chunks hold no marker at all: two substring scans over a lowered copy are far
+        # cheaper than a case-insensitive alternation search, so the regex only sees hits
+        low = text.lower()
+        if "error" in low or "traceback" in low:
+            n = len(text)
+            if len(low) != n:
+                low = None  # lower() resized some non-ASCII char: go line by line instead
+            else:
+                e, t = low.find("error"), low.find("traceback")
+            start = 0
+            while start < n:
+                if low is not None:
+                    # jump to the next line holding a candidate keyword
+                    if 0 <= e < start:
+                        e = low.find("error", start)
+                    if 0 <= t < start:
+                        t = low.find("traceback", start)
+                    hit = e if t < 0 or 0 <= e < t else t
+                    if hit < 0:
+                        break
+                    start = low.rfind("\n", 0, hit) + 1
+                stop = text.find("\n", start)
+                stop = n if stop < 0 else stop + 1
+                # the regex only sees a line's first _HIGHLIGHT_PROBE chars, so a long
+                # dumped line costs a bounded search; a marker past that stays plain
+                if _HIGHLIGHT_RE.search(text, start, min(stop, start + _HIGHLIGHT_PROBE)):
+                    if start > pos:
+                        cursor.insertText(text[pos:start], self._fmt_plain)
+                    cursor.insertText(text[start:stop], self._fmt_error)
+                    pos = stop
+                start = stop
+        if pos < len(text):
+            cursor.insertText(text[pos:], self._fmt_plain)
+        # jump the scrollbar instead of syncing the view cursor: no cursor-rect re-measure,
+        # and a selection made in the log survives output arriving
+        self._log_scroll.setValue(self._log_scroll.maximum())
 
     def set_status(self, text: str):
         self.lbl_status.setText(text)
 
     def show_script_clue(self):
         row = self.list_scripts.currentRow()
-        if row < 0 or row >= len(SCRIPTS):
+        if row < 0 or row >= len(SCRIPTS_COMPILED):
             clue = "No script selected."
         else:
-            clue = SCRIPTS[row].get("clue", "No clue available.")
+            clue = SCRIPTS_COMPILED[row].clue
         # Show tooltip near the clue button
         QToolTip.showText(self.btn_clue.mapToGlobal(self.btn_clue.rect().bottomLeft()), clue, self.btn_clue)
     
     # Add copy - paste option
     def _normalize_selected_text(self, text: str) -> str:
-        # In Qt, selectedText() replaces line breaks with U+2029 (paragraph separator)
-        return text.replace('\u2029', '\n').strip()
+        return text.replace(_PARAGRAPH_SEP, '\n').strip()
 
     def _focused_form_widget(self):
         """Return the currently focused input widget inside the dynamic form, or None."""
@@ -816,8 +1383,7 @@ class MainWindow(QMainWindow):
         if not w:
             return None
         # ensure it's one of our inputs
-        from PySide6.QtWidgets import QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox
-        if isinstance(w, (QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox)):
+        if isinstance(w, self._PASTE_TYPES):
             return w
         return None
 
@@ -826,80 +1392,113 @@ class MainWindow(QMainWindow):
         if not self.form or not getattr(self.form, "bindings", None):
             return None
         for b in self.form.bindings:
-            sch = b.get("schema", {})
-            if sch.get("required"):
-                return b.get("widget")
+            if b.schema.required:
+                return b.widget
         # else first field
-        return self.form.bindings[0]["widget"] if self.form.bindings else None
+        return self.form.bindings[0].widget if self.form.bindings else None
 
     def _set_widget_value(self, widget, text: str):
         """Set value into different widget types intelligently."""
-        from PySide6.QtWidgets import QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox
-        t = text.strip()
-
-        if isinstance(widget, QLineEdit):
-            widget.setText(t)
-            return True
-
-        if isinstance(widget, QSpinBox):
-            try:
-                widget.setValue(int(float(t)))
-                return True
-            except Exception:
-                self.show_message("Paste failed", "Selected text is not an integer.",QMessageBox.Warning)
+        setter = self._PASTE_SETTERS.get(type(widget))
+        if setter is None:
+            # subclasses of the input types (e.g. a custom line edit) resolve through the MRO
+            setter = next((self._PASTE_SETTERS[c] for c in type(widget).__mro__
+                           if c in self._PASTE_SETTERS), None)
+            if setter is None:
                 return False
+        return setter(self, widget, text.strip())
 
-        if isinstance(widget, QDoubleSpinBox):
-            try:
-                widget.setValue(float(t))
-                return True
-            except Exception:
-                self.show_message("Paste failed", "Selected text is not a number.",QMessageBox.Warning)
-                return False
+    def _paste_text(self, widget, t: str) -> bool:
+        widget.setText(t)
+        return True
 
-        if isinstance(widget, QComboBox):
-            # try exact match first
-            idx = widget.findText(t)
-            if idx >= 0:
-                widget.setCurrentIndex(idx)
-                return True
-            # if not found, set editable text if combo is editable
-            if widget.isEditable():
-                widget.setEditText(t)
-                return True
-            self.show_message("Paste failed", f"'{t}' is not an available option.",QMessageBox.Warning)
+    def _paste_int(self, widget, t: str) -> bool:
+        try:
+            widget.setValue(int(float(t)))
+            return True
+        except Exception:
+            self.show_message("Paste failed", "Selected text is not an integer.",QMessageBox.Warning)
             return False
 
-        if isinstance(widget, QCheckBox):
-            val = t.lower() in ("1", "true", "yes", "on")
-            widget.setChecked(val)
+    def _paste_float(self, widget, t: str) -> bool:
+        try:
+            widget.setValue(float(t))
             return True
+        except Exception:
+            self.show_message("Paste failed", "Selected text is not a number.",QMessageBox.Warning)
+            return False
 
+    def _paste_select(self, widget, t: str) -> bool:
+        # try exact match first
+        idx = widget.findText(t)
+        if idx >= 0:
+            widget.setCurrentIndex(idx)
+            return True
+        # if not found, set editable text if combo is editable
+        if widget.isEditable():
+            widget.setEditText(t)
+            return True
+        self.show_message("Paste failed", f"'{t}' is not an available option.",QMessageBox.Warning)
         return False
 
+    def _paste_checkbox(self, widget, t: str) -> bool:
+        val = t.lower() in _TRUTHY
+        widget.setChecked(val)
+        return True
+
+    # widget class -> paste handler; one lookup instead of an isinstance chain
+    _PASTE_SETTERS = {
+        QLineEdit: _paste_text,
+        QSpinBox: _paste_int,
+        QDoubleSpinBox: _paste_float,
+        QComboBox: _paste_select,
+        QCheckBox: _paste_checkbox,
+    }
+    _PASTE_TYPES = tuple(_PASTE_SETTERS)
+
+    def _release_process(self):
+        """Detach the previous QProcess from our slots, stop it and schedule it for deletion."""
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        # no late readyRead/finished from the old run reaches our slots
+        proc.finished.disconnect(self.on_proc_finished)
+        proc.errorOccurred.disconnect(self.on_proc_error)
+        if proc.receivers(SIGNAL("readyReadStandardOutput()")):
+            proc.readyReadStandardOutput.disconnect(self.on_proc_output)
+        if proc.state() != QProcess.NotRunning:
+            # reap it once it has exited instead of blocking the GUI thread on a wait
+            proc.finished.connect(proc.deleteLater)
+            proc.errorOccurred.connect(proc.deleteLater)
+            proc.kill()
+        else:
+            proc.deleteLater()
+        self._remove_output_file()
+
     def _clear_process_if_running(self):
         
-        if getattr(self,"proc", None) is not None:
-            try:
-                if self.proc.state():
-                    self.proc.kill()
-            except Exception:
-                pass
-            finally:
-                self.proc = None
+        if self.proc is not None:
+            self._release_process()
+        if self._inproc is not None:
+            # the thread cannot be stopped: drop its results, Run comes back when it ends
+            self._inproc.discarded = True
         
-        self.btn_run.setEnabled(True)
+        idle = self._inproc is None
+        self.btn_run.setEnabled(idle)
         self.btn_cancel.setEnabled(False)
-        self.list_scripts.setEnabled(True)
+        self.list_scripts.setEnabled(idle)
+
+    # buttons of the clear_all confirmation, combined once
+    _YES_NO = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
 
     def clear_all(self):
-        if getattr(self,"proc", None) is not None:
+        if self.proc is not None or self._inproc is not None:
 
             res = QMessageBox.question(
                 self, 
                 "Confirm",
                 "Kill it and clear the GUI?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                self._YES_NO,
                 QMessageBox.StandardButton.No #default
             )
 
@@ -909,17 +1508,21 @@ class MainWindow(QMainWindow):
         # Clear everything in the GUI
         self._clear_process_if_running()
 
+        self._flush_timer.stop()
+        self._log_buf.clear()
+        self._decoder.reset()
+        self._drop_pending_progress()
         self.txt_log.clear()
 
         self.progress.setRange(0,100)
         self.progress.setValue(0)
-        self.set_status("Ready")
+        self.set_status("Ready" if self._inproc is None else "Cleared; waiting for the in-process script to end")
         
         self.log_file_path = None
         self.lbl_log.setText("No file Selected")
 
         if self.current_script:
-            self.form.build(self.current_script.get("args_schema", []))
+            self.form.build(self.current_script.args_schema)
         else: 
             self.form.clear()
 
@@ -931,12 +1534,12 @@ class MainWindow(QMainWindow):
         cursor = self.txt_log.textCursor()
         
         if not cursor.hasSelection():
-            QMessageBox.information(self, "No selection", "Select text in the Log pane first.")
+            self.show_message("No selection", "Select text in the Log pane first.")
             return
         
         raw = self._normalize_selected_text(cursor.selectedText())
         if not raw:
-            QMessageBox.information(self, "No selection", "Select text in the Log pane first.")
+            self.show_message("No selection", "Select text in the Log pane first.")
             return
         
         target = self._focused_form_widget() or self._fallback_required_widget()
@@ -2,7 +2,6 @@ import sys
 import time
 import argparse
 import random
-import traceback
 
 def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
@@ -17,34 +16,42 @@ def main():
     ap.add_argument("--log", default="")      # harmless, if your GUI passes --log
     args = ap.parse_args()
 
-    print("=== Parser Test: START ===", flush=True)
+    # stdout is a pipe under the GUI (block-buffered by default): flush on every newline instead
+    sys.stdout.reconfigure(line_buffering=True)
+
+    print("=== Parser Test: START ===")
     if args.log:
-        print(f"[info] Received --log: {args.log}", flush=True)
-    print("[info] This test will include: normal, PROGRESS, error, traceback", flush=True)
+        print(f"[info] Received --log: {args.log}")
+    print("[info] This test will include: normal, PROGRESS, error, traceback")
     if args.stderr:
         eprint("[stderr] merged-channel test is ON")
 
     # Emit a couple of 'error' variants (case-insensitive test)
-    samples = [
+    samples = (
         "small error happened (lowercase error)",
         "Minor issue, not an Error but close",
         "no problem here",
         "TRACEBACK keyword appears alone",
         "ok line",
-    ]
+    )
+
+    # pick every sample line and progress value up front, outside the loop
+    steps = args.steps
+    rng = random.Random()  # own generator, not the shared module-level one
+    msgs = rng.choices(samples, k=steps + 1)
+    # integer round-half-up of i*100/steps, no float math
+    pcts = [(i * 100 + steps // 2) // steps for i in range(steps + 1)]
 
     # progress loop
-    for i in range(args.steps + 1):
-        pct = int(round(i * (100 / args.steps)))
+    # straight to the binary layer: one preformatted bytes blob and one flush per step
+    out = sys.stdout.buffer
+    write, flush = out.write, out.flush
+    for i in range(steps + 1):
         # 1) progress line that your GUI catches
-        print(f"PROGRESS {pct}", flush=True)
-
         # 2) a normal/info line
-        print(f"[info] working step {i}/{args.steps}", flush=True)
-
         # 3) occasionally inject interesting lines
-        msg = random.choice(samples)
-        print(msg, flush=True)
+        write(f"PROGRESS {pcts[i]}\n[info] working step {i}/{steps}\n{msgs[i]}\n".encode("utf-8"))
+        flush()
 
         # 4) sometimes write to stderr
         if args.stderr and i % 3 == 1:
@@ -53,23 +60,23 @@ def main():
         time.sleep(args.delay)
 
     # Emit a clean “error” line right before finish
-    print("ERROR: something went wrong but recovered", flush=True)
+    print("ERROR: something went wrong but recovered")
 
     # Optional real traceback block to test multi-line highlight
     if args.fail:
-        print("\nSimulating exception with traceback...\n", flush=True)
+        import traceback  # only this branch needs it; keeps it off the normal startup path
+        print("\nSimulating exception with traceback...\n")
         try:
             1 / 0
         except Exception:
             # real Python traceback text
             tb = traceback.format_exc()
-            # Print a canonical header your highlighter likely looks for:
-            print("Traceback (most recent call last):", flush=True)
-            # Then the full formatted traceback
-            for line in tb.strip().splitlines()[1:]:
-                print(line, flush=True)
+            # Print a canonical header your highlighter likely looks for,
+            # then the full formatted traceback, in one write
+            body = tb.strip().split("\n", 1)[1]
+            sys.stdout.write("Traceback (most recent call last):\n" + body + "\n")
 
-    print("=== Parser Test: END ===", flush=True)
+    print("=== Parser Test: END ===")
 
 if __name__ == "__main__":
     main()